@@ -5,13 +5,18 @@ single source of truth.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
 
 DAYS: Tuple[str, ...] = ("Mon", "Tue", "Wed", "Thu", "Fri")
 DAY_ORDER: Dict[str, int] = {day: idx for idx, day in enumerate(DAYS)}
 TRACKS: Tuple[int, ...] = (1, 2, 3, 4)
 
+# Bits reserved per day when packing (day, slot) pairs into an integer mask.
+SLOT_BITS_PER_DAY = 8
+NUM_SLOT_IDS = len(DAYS) * SLOT_BITS_PER_DAY
+
 # Slots available per day. Friday is limited to slots 4 and 5.
 SLOTS_BY_DAY: Dict[str, Tuple[int, ...]] = {
     "Mon": (1, 2, 3, 4, 5),
@@ -75,6 +80,8 @@ class SessionInstance:
     code: str
     subject: str
     students: Tuple[str, ...]
+    # Indices into ``TimetableData.students``, shared by all instances of a template.
+    student_ids: Tuple[int, ...]
 
 
 @dataclass
@@ -83,13 +90,32 @@ class TimetableData:
     day_order: Dict[str, int]
     slots_by_day: Dict[str, Tuple[int, ...]]
     tracks: Tuple[int, ...]
-    teacher_availability: Dict[str, Set[Tuple[str, int]]]
+    teacher_availability: Dict[str, FrozenSet[Tuple[str, int]]]
+    teacher_avail_mask: Dict[str, int]
+    teacher_feasible_slots: Dict[str, Tuple[Tuple[str, int], ...]]
     sessions: List[SessionInstance]
+    session_by_uid: Dict[str, SessionInstance]
     teachers: Tuple[str, ...]
     students: Tuple[str, ...]
+    subjects: Tuple[str, ...]
+    teacher_idx: Dict[str, int]
+    student_idx: Dict[str, int]
+    subject_idx: Dict[str, int]
 
     def is_teacher_available(self, teacher: str, day: str, slot: int) -> bool:
-        return (day, slot) in self.teacher_availability.get(teacher, set())
+        day_index = self.day_order.get(day)
+        if day_index is None or not 0 <= slot < SLOT_BITS_PER_DAY:
+            return False
+        mask = self.teacher_avail_mask.get(teacher, 0)
+        return bool((mask >> slot_bit(day_index, slot)) & 1)
+
+
+def slot_bit(day_index: int, slot: int) -> int:
+    """Integer id of ``(day, slot)``, also its bit position in an availability mask.
+
+    Ids are below ``NUM_SLOT_IDS`` and sort in (day, slot) order.
+    """
+    return day_index * SLOT_BITS_PER_DAY + slot
 
 
 def _session_templates() -> Sequence[SessionTemplate]:
@@ -134,39 +160,94 @@ def _session_templates() -> Sequence[SessionTemplate]:
     )
 
 
-def expand_templates(templates: Sequence[SessionTemplate]) -> List[SessionInstance]:
-    """Expand templates into unique session instances."""
+def expand_templates(
+    templates: Sequence[SessionTemplate],
+    student_idx: Dict[str, int],
+) -> List[SessionInstance]:
+    """Expand templates into unique session instances.
+
+    ``student_idx`` maps every student name to its index in
+    ``TimetableData.students``; an unknown student raises ``KeyError``.
+    """
     expanded: List[SessionInstance] = []
     for template in templates:
+        # Interned names let tuple-key comparisons short-circuit on identity.
+        teacher = sys.intern(template.teacher)
+        code = sys.intern(template.code)
+        subject = sys.intern(template.subject)
+        students = tuple(sys.intern(student) for student in template.students)
+        student_ids = tuple(student_idx[student] for student in students)
         for idx in range(1, template.multiplicity + 1):
-            uid = f"{template.code}_{template.teacher}_{idx}"
+            uid = f"{code}_{teacher}_{idx}"
             expanded.append(
                 SessionInstance(
                     uid=uid,
-                    teacher=template.teacher,
-                    code=template.code,
-                    subject=template.subject,
-                    students=template.students,
+                    teacher=teacher,
+                    code=code,
+                    subject=subject,
+                    students=students,
+                    student_ids=student_ids,
                 )
             )
     return expanded
 
 
-def _flatten_teacher_availability() -> Dict[str, Set[Tuple[str, int]]]:
-    flat: Dict[str, Set[Tuple[str, int]]] = {}
+def _flatten_teacher_availability() -> Dict[str, FrozenSet[Tuple[str, int]]]:
+    flat: Dict[str, FrozenSet[Tuple[str, int]]] = {}
     for teacher, day_map in TEACHER_AVAILABILITY.items():
         slots: Set[Tuple[str, int]] = set()
         for day, day_slots in day_map.items():
+            day = sys.intern(day)
             for slot in day_slots:
                 slots.add((day, slot))
-        flat[teacher] = slots
+        flat[sys.intern(teacher)] = frozenset(slots)
     return flat
 
 
-def _collect_students(instances: Sequence[SessionInstance]) -> Tuple[str, ...]:
+def _validate_slots() -> None:
+    """Ensure every slot fits in its day's bits so slot ids never alias."""
+    sources = [("SLOTS_BY_DAY", SLOTS_BY_DAY)]
+    sources.extend(
+        (f"TEACHER_AVAILABILITY[{teacher!r}]", day_map) for teacher, day_map in TEACHER_AVAILABILITY.items()
+    )
+    for label, day_map in sources:
+        for day, day_slots in day_map.items():
+            if day not in DAY_ORDER:
+                raise ValueError(f"{label} references unknown day {day!r}")
+            for slot in day_slots:
+                if not 0 <= slot < SLOT_BITS_PER_DAY:
+                    raise ValueError(
+                        f"{label}[{day!r}] has slot {slot}; slots must be in [0, {SLOT_BITS_PER_DAY})"
+                    )
+
+
+def _teacher_availability_masks(availability: Dict[str, FrozenSet[Tuple[str, int]]]) -> Dict[str, int]:
+    masks: Dict[str, int] = {}
+    for teacher, slots in availability.items():
+        mask = 0
+        for day, slot in slots:
+            mask |= 1 << slot_bit(DAY_ORDER[day], slot)
+        masks[teacher] = mask
+    return masks
+
+
+def _teacher_feasible_slots(masks: Dict[str, int]) -> Dict[str, Tuple[Tuple[str, int], ...]]:
+    """Ordered (day, slot) pairs each teacher can take, shared by all their sessions."""
+    feasible: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+    for teacher, mask in masks.items():
+        feasible[teacher] = tuple(
+            (day, slot)
+            for day_idx, day in enumerate(DAYS)
+            for slot in SLOTS_BY_DAY.get(day, ())
+            if (mask >> slot_bit(day_idx, slot)) & 1
+        )
+    return feasible
+
+
+def _collect_students(templates: Sequence[SessionTemplate]) -> Tuple[str, ...]:
     unique: Set[str] = set()
-    for inst in instances:
-        unique.update(inst.students)
+    for template in templates:
+        unique.update(sys.intern(student) for student in template.students)
     return tuple(sorted(unique))
 
 
@@ -175,19 +256,39 @@ def _collect_teachers(instances: Sequence[SessionInstance]) -> Tuple[str, ...]:
     return tuple(sorted(unique))
 
 
+def _collect_subjects(instances: Sequence[SessionInstance]) -> Tuple[str, ...]:
+    unique: Set[str] = {inst.subject for inst in instances}
+    return tuple(sorted(unique))
+
+
 def load_data() -> TimetableData:
     """Load all static inputs for the solver."""
-    instances = expand_templates(_session_templates())
+    _validate_slots()
+    templates = _session_templates()
+    students = _collect_students(templates)
+    student_idx = {student: idx for idx, student in enumerate(students)}
+    instances = expand_templates(templates, student_idx)
+    availability = _flatten_teacher_availability()
+    masks = _teacher_availability_masks(availability)
+    teachers = _collect_teachers(instances)
+    subjects = _collect_subjects(instances)
     return TimetableData(
         days=DAYS,
         day_order=DAY_ORDER,
         slots_by_day=SLOTS_BY_DAY,
         tracks=TRACKS,
-        teacher_availability=_flatten_teacher_availability(),
+        teacher_availability=availability,
+        teacher_avail_mask=masks,
+        teacher_feasible_slots=_teacher_feasible_slots(masks),
         sessions=instances,
-        teachers=_collect_teachers(instances),
-        students=_collect_students(instances),
+        session_by_uid={inst.uid: inst for inst in instances},
+        teachers=teachers,
+        students=students,
+        subjects=subjects,
+        teacher_idx={teacher: idx for idx, teacher in enumerate(teachers)},
+        student_idx=student_idx,
+        subject_idx={subject: idx for idx, subject in enumerate(subjects)},
     )
 
 
-__all__ = ["TimetableData", "SessionInstance", "load_data"]
+__all__ = ["TimetableData", "SessionInstance", "load_data", "slot_bit", "NUM_SLOT_IDS"]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import json
 import os
 import signal
@@ -9,6 +10,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
@@ -16,9 +18,9 @@ from urllib.parse import urlparse
 from ortools.sat.python import cp_model
 
 try:  # Allow running as `python server.py` or `python -m solver_with_ui.server`.
-    from .data_model import TimetableData, load_data
+    from .data_model import NUM_SLOT_IDS, SLOT_BITS_PER_DAY, TimetableData, load_data, slot_bit
 except ImportError:  # pragma: no cover - fallback for script execution
-    from data_model import TimetableData, load_data  # type: ignore
+    from data_model import NUM_SLOT_IDS, SLOT_BITS_PER_DAY, TimetableData, load_data, slot_bit  # type: ignore
 
 BASE_DIR = Path(__file__).resolve().parent
 UI_DIR = BASE_DIR / "ui"
@@ -28,9 +30,22 @@ SOFT_CSV = BASE_DIR / "relaxed_timetable.csv"
 
 HARD_SOLVER_TIME = 5.0  # seconds
 SOFT_SOLVER_TIME = 15.0  # seconds
+MAX_SEARCH_WORKERS = 8
+GZIP_LEVEL = 9
+RESPONSE_BUFFER_SIZE = 64 * 1024  # bytes; larger than any cached asset
 
 TIMETABLE_PAYLOAD: Optional[Dict[str, object]] = None
 TIMETABLE_SOURCE: Optional[str] = None
+TIMETABLE_JSON_BYTES: Optional[bytes] = None
+TIMETABLE_JSON_GZIP: Optional[bytes] = None
+
+STATIC_FILES: Tuple[str, ...] = ("index.html", "styles.css", "app.jsx")
+STATIC_CACHE: Dict[str, bytes] = {}
+GZIP_CACHE: Dict[str, bytes] = {}
+
+
+# Candidate (day, slot, variable) options for each session, keyed by uid.
+Assignment = Dict[str, List[Tuple[str, int, cp_model.IntVar]]]
 
 
 @dataclass
@@ -39,74 +54,128 @@ class SolveOutcome:
     status: int
 
 
-def _candidate_slots(session, data: TimetableData) -> List[Tuple[str, int]]:
-    slots: List[Tuple[str, int]] = []
-    for day in data.days:
-        for slot in data.slots_by_day.get(day, ()):  # type: ignore[arg-type]
-            if data.is_teacher_available(session.teacher, day, slot):
-                slots.append((day, slot))
-    return slots
-
-
-def build_greedy_seed(data: TimetableData) -> Dict[str, Tuple[str, int]]:
-    day_cap: Dict[Tuple[str, int], int] = defaultdict(int)
-    teacher_busy: Dict[Tuple[str, str, int], bool] = {}
-    student_slot_busy: Dict[Tuple[str, str, int], bool] = {}
-    student_subject_day: Dict[Tuple[str, str, str], bool] = {}
-    student_daily_count: Dict[Tuple[str, str], int] = defaultdict(int)
-
-    all_candidates: Dict[str, List[Tuple[str, int]]] = {
-        session.uid: _candidate_slots(session, data) for session in data.sessions
-    }
-
-    order = sorted(
-        data.sessions,
-        key=lambda s: (len(all_candidates[s.uid]), -len(s.students), s.teacher, s.code),
-    )
-
-    seed: Dict[str, Tuple[str, int]] = {}
-
-    for session in order:
-        candidates = all_candidates[session.uid]
-        if not candidates:
-            return {}
-        candidates.sort(
-            key=lambda item: (day_cap[item], data.day_order[item[0]], item[1])
-        )
-        chosen: Optional[Tuple[str, int]] = None
-        for day, slot in candidates:
-            if teacher_busy.get((session.teacher, day, slot)):
+def _candidate_slots(session, data: TimetableData) -> Sequence[Tuple[str, int]]:
+    return data.teacher_feasible_slots.get(session.teacher, ())
+
+
+def _greedy_seed_slots(
+    session_teachers: Sequence[int],
+    session_subjects: Sequence[int],
+    session_students: Sequence[Sequence[int]],
+    session_candidates: Sequence[Sequence[int]],
+    order: Sequence[int],
+    num_teachers: int,
+    num_students: int,
+    num_days: int,
+    num_subjects: int,
+) -> List[int]:
+    """Greedily place sessions using integer ids only.
+
+    Sessions are visited in ``order``; each gets the chosen slot id, or -1 if
+    the pass stopped before placing it. Candidate slot ids must be ascending.
+    """
+    # Per-slot bookkeeping lives in flat arrays indexed by
+    # ``person_idx * NUM_SLOT_IDS + slot_id`` to avoid hashing tuple keys.
+    # Per-day bookkeeping uses ``student_idx * num_days + day_idx`` the same way.
+    day_cap: List[int] = [0] * NUM_SLOT_IDS
+    teacher_busy = bytearray(num_teachers * NUM_SLOT_IDS)
+    student_slot_busy = bytearray(num_students * NUM_SLOT_IDS)
+    student_subject_day = bytearray(num_students * num_days * num_subjects)
+    student_daily_count = bytearray(num_students * num_days)
+    chosen_slots = [-1] * len(session_teachers)
+
+    for session_id in order:
+        teacher_base = session_teachers[session_id] * NUM_SLOT_IDS
+        subject_id = session_subjects[session_id]
+        student_ids = session_students[session_id]
+        # Pick the valid candidate with the lowest slot load, earliest slot
+        # first on ties. An empty slot cannot be beaten, so stop there.
+        chosen = -1
+        chosen_load = 4
+        for slot_id in session_candidates[session_id]:
+            load = day_cap[slot_id]
+            if load >= chosen_load:
                 continue
-            if day_cap[(day, slot)] >= 4:
+            if teacher_busy[teacher_base + slot_id]:
                 continue
+            day_idx = slot_id // SLOT_BITS_PER_DAY
             violation = False
-            for student in session.students:
-                if student_slot_busy.get((student, day, slot)):
-                    violation = True
-                    break
-                if student_subject_day.get((student, day, session.subject)):
-                    violation = True
-                    break
-                if student_daily_count[(student, day)] >= 3:
+            for s_idx in student_ids:
+                day_key = s_idx * num_days + day_idx
+                if (
+                    student_slot_busy[s_idx * NUM_SLOT_IDS + slot_id]
+                    or student_subject_day[day_key * num_subjects + subject_id]
+                    or student_daily_count[day_key] >= 3
+                ):
                     violation = True
                     break
             if violation:
                 continue
-            chosen = (day, slot)
+            chosen = slot_id
+            chosen_load = load
+            if load == 0:
+                break
+
+        if chosen < 0:
             break
 
-        if chosen is None:
-            return {}
+        chosen_slots[session_id] = chosen
+        day_idx = chosen // SLOT_BITS_PER_DAY
+        day_cap[chosen] += 1
+        teacher_busy[teacher_base + chosen] = 1
+        for s_idx in student_ids:
+            day_key = s_idx * num_days + day_idx
+            student_slot_busy[s_idx * NUM_SLOT_IDS + chosen] = 1
+            student_subject_day[day_key * num_subjects + subject_id] = 1
+            student_daily_count[day_key] += 1
+
+    return chosen_slots
+
+
+def build_greedy_seed(data: TimetableData) -> Dict[str, Tuple[str, int]]:
+    sessions = data.sessions
+    day_order = data.day_order
+
+    # Candidates are shared per teacher and sorted once by slot id, which is
+    # (day, slot) order; the greedy pass never re-sorts them.
+    teacher_candidates: Dict[str, Tuple[int, ...]] = {}
+    for session in sessions:
+        if session.teacher not in teacher_candidates:
+            teacher_candidates[session.teacher] = tuple(
+                sorted(slot_bit(day_order[day], slot) for day, slot in _candidate_slots(session, data))
+            )
+    session_candidates = [teacher_candidates[session.teacher] for session in sessions]
+    if not all(session_candidates):
+        return {}
+
+    order = sorted(
+        range(len(sessions)),
+        key=lambda i: (
+            len(session_candidates[i]),
+            -len(sessions[i].students),
+            sessions[i].teacher,
+            sessions[i].code,
+        ),
+    )
 
-        day, slot = chosen
-        seed[session.uid] = chosen
-        day_cap[(day, slot)] += 1
-        teacher_busy[(session.teacher, day, slot)] = True
-        for student in session.students:
-            student_slot_busy[(student, day, slot)] = True
-            student_subject_day[(student, day, session.subject)] = True
-            student_daily_count[(student, day)] += 1
+    chosen_slots = _greedy_seed_slots(
+        session_teachers=[data.teacher_idx[session.teacher] for session in sessions],
+        session_subjects=[data.subject_idx[session.subject] for session in sessions],
+        session_students=[session.student_ids for session in sessions],
+        session_candidates=session_candidates,
+        order=order,
+        num_teachers=len(data.teachers),
+        num_students=len(data.students),
+        num_days=len(data.days),
+        num_subjects=len(data.subjects),
+    )
+    if -1 in chosen_slots:
+        return {}
 
+    seed: Dict[str, Tuple[str, int]] = {}
+    for session, slot_id in zip(sessions, chosen_slots):
+        day_idx, slot = divmod(slot_id, SLOT_BITS_PER_DAY)
+        seed[session.uid] = (data.days[day_idx], slot)
     return seed
 
 
@@ -114,36 +183,51 @@ def _build_model(
     data: TimetableData,
     relax: bool,
     seed: Optional[Dict[str, Tuple[str, int]]] = None,
-) -> Tuple[cp_model.CpModel, Dict[Tuple[str, str, int], cp_model.IntVar]]:
+) -> Tuple[cp_model.CpModel, Assignment]:
     model = cp_model.CpModel()
-    assignment: Dict[Tuple[str, str, int], cp_model.IntVar] = {}
-    session_vars: Dict[str, List[cp_model.IntVar]] = defaultdict(list)
-    teacher_day_slot: Dict[Tuple[str, str, int], List[cp_model.IntVar]] = defaultdict(list)
-    student_day_slot: Dict[Tuple[str, str, int], List[cp_model.IntVar]] = defaultdict(list)
-    student_day_subject: Dict[Tuple[str, str, str], List[cp_model.IntVar]] = defaultdict(list)
-    student_day_total: Dict[Tuple[str, str], List[cp_model.IntVar]] = defaultdict(list)
-    day_slot_capacity: Dict[Tuple[str, int], List[cp_model.IntVar]] = defaultdict(list)
+    assignment: Assignment = {}
+
+    # Constraint buckets are flat lists indexed by small integer keys:
+    # ``person_idx * NUM_SLOT_IDS + slot_id`` for per-slot buckets and
+    # ``student_idx * num_days + day_idx`` for per-day buckets.
+    num_days = len(data.days)
+    num_subjects = len(data.subjects)
+    num_students = len(data.students)
+    teacher_day_slot: List[List[cp_model.IntVar]] = [[] for _ in range(len(data.teachers) * NUM_SLOT_IDS)]
+    student_day_slot: List[List[cp_model.IntVar]] = [[] for _ in range(num_students * NUM_SLOT_IDS)]
+    student_day_subject: List[List[cp_model.IntVar]] = [
+        [] for _ in range(num_students * num_days * num_subjects)
+    ]
+    student_day_total: List[List[cp_model.IntVar]] = [[] for _ in range(num_students * num_days)]
+    day_slot_capacity: List[List[cp_model.IntVar]] = [[] for _ in range(NUM_SLOT_IDS)]
+
+    new_bool_var = model.NewBoolVar
+    day_order = data.day_order
 
     for session in data.sessions:
-        for day in data.days:
-            for slot in data.slots_by_day.get(day, ()):  # type: ignore[arg-type]
-                if not data.is_teacher_available(session.teacher, day, slot):
-                    continue
-                var = model.NewBoolVar(f"x_{session.uid}_{day}_{slot}")
-                assignment[(session.uid, day, slot)] = var
-                session_vars[session.uid].append(var)
-                teacher_day_slot[(session.teacher, day, slot)].append(var)
-                day_slot_capacity[(day, slot)].append(var)
-                for student in session.students:
-                    student_day_slot[(student, day, slot)].append(var)
-                    student_day_subject[(student, day, session.subject)].append(var)
-                    student_day_total[(student, day)].append(var)
+        uid = session.uid
+        teacher_base = data.teacher_idx[session.teacher] * NUM_SLOT_IDS
+        subject_id = data.subject_idx[session.subject]
+        student_ids = session.student_ids
+        session_assignment = assignment[uid] = []
+        for day, slot in _candidate_slots(session, data):
+            day_idx = day_order[day]
+            slot_id = slot_bit(day_idx, slot)
+            var = new_bool_var(f"x_{uid}_{day}_{slot}")
+            session_assignment.append((day, slot, var))
+            teacher_day_slot[teacher_base + slot_id].append(var)
+            day_slot_capacity[slot_id].append(var)
+            for s_idx in student_ids:
+                day_key = s_idx * num_days + day_idx
+                student_day_slot[s_idx * NUM_SLOT_IDS + slot_id].append(var)
+                student_day_subject[day_key * num_subjects + subject_id].append(var)
+                student_day_total[day_key].append(var)
 
     for session in data.sessions:
-        vars_for_session = session_vars.get(session.uid)
-        if not vars_for_session:
+        options = assignment[session.uid]
+        if not options:
             raise ValueError(f"No feasible slots for session {session.uid}")
-        model.Add(sum(vars_for_session) == 1)
+        model.Add(sum(var for _, _, var in options) == 1)
 
     penalties: List[Tuple[cp_model.IntVar, int]] = []
 
@@ -166,27 +250,44 @@ def _build_model(
         model.Add(sum(vars_list) <= limit + slack)
         penalties.append((slack, weight))
 
-    for (teacher, day, slot), vars_list in teacher_day_slot.items():
-        add_upper_bound(vars_list, 1, 1000, f"teacher_{teacher}_{day}_{slot}", enforce_hard=True)
+    def slot_label(slot_id: int) -> str:
+        day_idx, slot = divmod(slot_id, SLOT_BITS_PER_DAY)
+        return f"{data.days[day_idx]}_{slot}"
 
-    for (student, day, slot), vars_list in student_day_slot.items():
-        add_upper_bound(vars_list, 1, 1000, f"student_slot_{student}_{day}_{slot}")
+    for key, vars_list in enumerate(teacher_day_slot):
+        if vars_list:
+            teacher_id, slot_id = divmod(key, NUM_SLOT_IDS)
+            label = f"teacher_{data.teachers[teacher_id]}_{slot_label(slot_id)}"
+            add_upper_bound(vars_list, 1, 1000, label, enforce_hard=True)
+
+    for key, vars_list in enumerate(student_day_slot):
+        if vars_list:
+            s_idx, slot_id = divmod(key, NUM_SLOT_IDS)
+            add_upper_bound(vars_list, 1, 1000, f"student_slot_{data.students[s_idx]}_{slot_label(slot_id)}")
 
-    for (student, day, subject), vars_list in student_day_subject.items():
-        add_upper_bound(vars_list, 1, 700, f"subject_{student}_{day}_{subject}")
+    for key, vars_list in enumerate(student_day_subject):
+        if vars_list:
+            day_key, subject_id = divmod(key, num_subjects)
+            s_idx, day_idx = divmod(day_key, num_days)
+            label = f"subject_{data.students[s_idx]}_{data.days[day_idx]}_{data.subjects[subject_id]}"
+            add_upper_bound(vars_list, 1, 700, label)
 
-    for (student, day), vars_list in student_day_total.items():
-        add_upper_bound(vars_list, 3, 500, f"daily_load_{student}_{day}")
+    for key, vars_list in enumerate(student_day_total):
+        if vars_list:
+            s_idx, day_idx = divmod(key, num_days)
+            add_upper_bound(vars_list, 3, 500, f"daily_load_{data.students[s_idx]}_{data.days[day_idx]}")
 
-    for key, vars_list in day_slot_capacity.items():
+    for vars_list in day_slot_capacity:
         if vars_list:
             model.Add(sum(vars_list) <= 4)
 
-    if seed:
-        for (session_uid, day, slot), var in assignment.items():
-            if session_uid in seed:
-                target_day, target_slot = seed[session_uid]
-                model.AddHint(var, 1 if (day, slot) == (target_day, target_slot) else 0)
+    # Only the seeded variable of each session is hinted; the exactly-one
+    # constraint above propagates the rest of the session to 0.
+    for uid, target in (seed or {}).items():
+        for day, slot, var in assignment.get(uid, ()):
+            if (day, slot) == target:
+                model.AddHint(var, 1)
+                break
 
     if relax:
         objective_terms = [weight * slack for slack, weight in penalties]
@@ -197,15 +298,20 @@ def _build_model(
 
 def _extract_entries(
     solver: cp_model.CpSolver,
-    assignment: Dict[Tuple[str, str, int], cp_model.IntVar],
+    assignment: Assignment,
     data: TimetableData,
 ) -> List[Dict[str, object]]:
-    session_lookup = {session.uid: session for session in data.sessions}
-    entries: List[Dict[str, object]] = []
-    for (session_uid, day, slot), var in assignment.items():
-        if solver.Value(var):
+    session_lookup = data.session_by_uid
+    day_order = data.day_order
+    # Entries go straight into per-slot buckets keyed by slot id, which sorts
+    # in (day, slot) order, so no global sort over all entries is needed.
+    track_buckets: Dict[int, List[Dict[str, object]]] = defaultdict(list)
+    for session_uid, options in assignment.items():
+        for day, slot, var in options:
+            if not solver.Value(var):
+                continue
             session = session_lookup[session_uid]
-            entries.append(
+            track_buckets[slot_bit(day_order[day], slot)].append(
                 {
                     "uid": session_uid,
                     "day": day,
@@ -216,23 +322,21 @@ def _extract_entries(
                     "students": list(session.students),
                 }
             )
+            # Exactly one option per session is selected.
+            break
 
-    entries.sort(key=lambda e: (data.day_order[e["day"]], e["slot"], e["teacher"], e["code"]))
-    track_buckets: Dict[Tuple[str, int], List[Dict[str, object]]] = defaultdict(list)
-    for entry in entries:
-        track_buckets[(entry["day"], entry["slot"])].append(entry)
-
-    for key, bucket in track_buckets.items():
-        bucket.sort(key=lambda e: (e["teacher"], e["code"], e["uid"]))
+    entries: List[Dict[str, object]] = []
+    bucket_key = itemgetter("teacher", "code", "uid")
+    for slot_id in sorted(track_buckets):
+        bucket = track_buckets[slot_id]
         if len(bucket) > 4:
-            raise ValueError(f"Slot capacity exceeded for {key}")
+            day_idx, slot = divmod(slot_id, SLOT_BITS_PER_DAY)
+            raise ValueError(f"Slot capacity exceeded for {(data.days[day_idx], slot)}")
+        bucket.sort(key=bucket_key)
         for track_idx, entry in enumerate(bucket, start=1):
             entry["track"] = track_idx
-
-    entries.sort(key=lambda e: (data.day_order[e["day"]], e["slot"], e["track"], e["teacher"], e["code"]))
-
-    for entry in entries:
-        entry.pop("uid", None)
+            del entry["uid"]
+            entries.append(entry)
 
     return entries
 
@@ -242,20 +346,22 @@ def _solve_once(
     relax: bool,
     time_limit: float,
     seed: Optional[Dict[str, Tuple[str, int]]] = None,
-    force_seed: bool = False,
 ) -> SolveOutcome:
     model, assignment = _build_model(data, relax=relax, seed=seed)
-
-    if seed and force_seed:
-        for (session_uid, day, slot), var in assignment.items():
-            if session_uid in seed:
-                if (day, slot) == seed[session_uid]:
-                    model.Add(var == 1)
-                else:
-                    model.Add(var == 0)
     solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = 5.0 if force_seed else time_limit
-    solver.parameters.num_search_workers = 8
+    solver.parameters.max_time_in_seconds = time_limit
+    workers = min(MAX_SEARCH_WORKERS, os.cpu_count() or 1)
+    solver.parameters.num_search_workers = workers
+    if not relax:
+        # Pure feasibility over booleans: the LP relaxation has nothing to bound.
+        solver.parameters.linearization_level = 0
+    elif workers == 1:
+        # Without parallel workers, interleave the portfolio in one thread so
+        # the relaxed objective still gets core-based and LNS search.
+        solver.parameters.interleave_search = True
+    # The greedy seed is passed as a plain hint. repair_hint is deliberately
+    # left off: OR-Tools 9.14 aborts (check failure on fixed_search) when it
+    # is combined with multiple search workers.
     status = solver.Solve(model)
 
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
@@ -265,30 +371,43 @@ def _solve_once(
     return SolveOutcome(entries=entries, status=status)
 
 
-def _run_with_fallback(data: TimetableData) -> Tuple[List[Dict[str, object]], str]:
-    seed = build_greedy_seed(data)
-    hard_outcome = None
-    if seed:
-        hard_outcome = _solve_once(
-            data,
-            relax=False,
-            time_limit=HARD_SOLVER_TIME,
-            seed=seed,
-            force_seed=True,
-        )
-        if hard_outcome.entries is None:
-            hard_outcome = _solve_once(
-                data,
-                relax=False,
-                time_limit=HARD_SOLVER_TIME,
-                seed=seed,
+def _check_pigeonhole(data: TimetableData) -> None:
+    """Reject inputs that no model can satisfy before invoking CP-SAT.
+
+    Teacher clashes and slot capacity stay hard even in the relaxed model, so
+    a teacher with more sessions than available slots, or more sessions than
+    tracks across all usable slots, is infeasible under both solves.
+    """
+    session_counts: Dict[str, int] = defaultdict(int)
+    for session in data.sessions:
+        session_counts[session.teacher] += 1
+
+    usable_slots = set()
+    for teacher, count in session_counts.items():
+        feasible = data.teacher_feasible_slots.get(teacher, ())
+        if count > len(feasible):
+            raise RuntimeError(
+                f"Infeasible: teacher {teacher} has {count} sessions but only {len(feasible)} available slots."
             )
-    else:
-        hard_outcome = _solve_once(
-            data,
-            relax=False,
-            time_limit=HARD_SOLVER_TIME,
+        usable_slots.update(feasible)
+
+    capacity = len(data.tracks) * len(usable_slots)
+    if len(data.sessions) > capacity:
+        raise RuntimeError(
+            f"Infeasible: {len(data.sessions)} sessions exceed capacity of {capacity} "
+            f"({len(usable_slots)} usable slots x {len(data.tracks)} tracks)."
         )
+
+
+def _run_with_fallback(data: TimetableData) -> Tuple[List[Dict[str, object]], str]:
+    _check_pigeonhole(data)
+    seed = build_greedy_seed(data)
+    hard_outcome = _solve_once(
+        data,
+        relax=False,
+        time_limit=HARD_SOLVER_TIME,
+        seed=seed if seed else None,
+    )
     if hard_outcome.entries is not None:
         return hard_outcome.entries, "timetable.csv"
 
@@ -331,19 +450,21 @@ def _write_outputs(payload: Dict[str, object], csv_filename: str) -> None:
     with open(csv_path, "w", newline="", encoding="utf-8") as csv_file:
         writer = csv.writer(csv_file)
         writer.writerow(["Day", "Slot", "Track", "Teacher", "Code", "Subject", "Students"])
-        for row in rows:
-            writer.writerow(
-                [
-                    row["day"],
-                    row["slot"],
-                    row["track"],
-                    row["teacher"],
-                    row["code"],
-                    row["subject"],
-                    ", ".join(row["students"]),
-                ]
-            )
+        writer.writerows(
+            [
+                row["day"],
+                row["slot"],
+                row["track"],
+                row["teacher"],
+                row["code"],
+                row["subject"],
+                ", ".join(row["students"]),
+            ]
+            for row in rows
+        )
 
+    # Kept indented: the JSON file is checked in and reviewed by hand. The HTTP
+    # API serves its own compact encoding.
     with open(JSON_PATH, "w", encoding="utf-8") as json_file:
         json.dump(payload, json_file, indent=2)
 
@@ -352,29 +473,93 @@ def _write_outputs(payload: Dict[str, object], csv_filename: str) -> None:
         stale_path.unlink()
 
 
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Return True if an ``Accept-Encoding`` header allows a gzip body.
+
+    An explicit ``gzip`` coding takes precedence over ``*``; either only
+    counts when its ``q`` value is above zero.
+
+    >>> accepts_gzip("gzip, deflate")
+    True
+    >>> accepts_gzip("gzip;q=0, identity")
+    False
+    >>> accepts_gzip("identity, *;q=0.5")
+    True
+    >>> accepts_gzip("*;q=1, gzip;q=0")
+    False
+    >>> accepts_gzip("br, xgzip")
+    False
+    """
+    gzip_q: Optional[float] = None
+    wildcard_q: Optional[float] = None
+    for part in accept_encoding.split(","):
+        coding, *params = [item.strip() for item in part.split(";")]
+        coding = coding.lower()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "*":
+            wildcard_q = q
+        else:
+            gzip_q = q
+    if gzip_q is not None:
+        return gzip_q > 0
+    return wildcard_q is not None and wildcard_q > 0
+
+
 class TimetableHandler(BaseHTTPRequestHandler):
     server_version = "TimetableHTTP/1.0"
+    # Buffer the response stream so the status line, headers and body leave
+    # in a single write when flushed.
+    wbufsize = RESPONSE_BUFFER_SIZE
 
-    def _ensure_payload(self) -> Dict[str, object]:
-        if TIMETABLE_PAYLOAD is None:
+    def _ensure_payload(self) -> bytes:
+        if TIMETABLE_JSON_BYTES is None:
             self.send_error(HTTPStatus.SERVICE_UNAVAILABLE, "Timetable not ready")
             raise RuntimeError("Timetable not ready")
-        return TIMETABLE_PAYLOAD
+        return TIMETABLE_JSON_BYTES
 
-    def _serve_bytes(self, content: bytes, content_type: str) -> None:
+    def _accepts_gzip(self) -> bool:
+        return accepts_gzip(self.headers.get("Accept-Encoding", ""))
+
+    def _serve_bytes(
+        self,
+        content: bytes,
+        content_type: str,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(content)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
         self.wfile.write(content)
+        self.wfile.flush()
+
+    def _serve_cached(self, content: bytes, gzipped: Optional[bytes], content_type: str) -> None:
+        if gzipped is not None and self._accepts_gzip():
+            self._serve_bytes(
+                gzipped,
+                content_type,
+                {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+            )
+        else:
+            self._serve_bytes(content, content_type, {"Vary": "Accept-Encoding"})
 
     def _serve_file(self, relative_path: str, content_type: str) -> None:
-        target = UI_DIR / relative_path
-        if not target.exists():
+        content = STATIC_CACHE.get(relative_path)
+        if content is None:
             self.send_error(HTTPStatus.NOT_FOUND, "File not found")
             return
-        content = target.read_bytes()
-        self._serve_bytes(content, content_type)
+        self._serve_cached(content, GZIP_CACHE.get(relative_path), content_type)
 
     def do_GET(self) -> None:  # noqa: N802 (BaseHTTPRequestHandler naming)
         parsed = urlparse(self.path)
@@ -386,9 +571,8 @@ class TimetableHandler(BaseHTTPRequestHandler):
         elif path == "/app.jsx":
             self._serve_file("app.jsx", "text/javascript; charset=utf-8")
         elif path == "/api/timetable":
-            payload = self._ensure_payload()
-            body = json.dumps(payload).encode("utf-8")
-            self._serve_bytes(body, "application/json; charset=utf-8")
+            body = self._ensure_payload()
+            self._serve_cached(body, TIMETABLE_JSON_GZIP, "application/json; charset=utf-8")
         else:
             self.send_error(HTTPStatus.NOT_FOUND, "Not found")
 
@@ -406,9 +590,25 @@ def initialize_timetable() -> Tuple[Dict[str, object], str]:
     return payload, csv_name
 
 
+def _load_static_assets() -> Dict[str, bytes]:
+    """Read the UI assets once so requests never touch the disk."""
+    cache: Dict[str, bytes] = {}
+    for name in STATIC_FILES:
+        target = UI_DIR / name
+        if target.exists():
+            cache[name] = target.read_bytes()
+    return cache
+
+
 def run_server(host: Optional[str] = None, port: Optional[int] = None) -> None:
-    global TIMETABLE_PAYLOAD, TIMETABLE_SOURCE
+    global TIMETABLE_PAYLOAD, TIMETABLE_SOURCE, TIMETABLE_JSON_BYTES, TIMETABLE_JSON_GZIP
     TIMETABLE_PAYLOAD, TIMETABLE_SOURCE = initialize_timetable()
+    TIMETABLE_JSON_BYTES = json.dumps(TIMETABLE_PAYLOAD).encode("utf-8")
+    TIMETABLE_JSON_GZIP = gzip.compress(TIMETABLE_JSON_BYTES, GZIP_LEVEL)
+    STATIC_CACHE.clear()
+    STATIC_CACHE.update(_load_static_assets())
+    GZIP_CACHE.clear()
+    GZIP_CACHE.update({name: gzip.compress(content, GZIP_LEVEL) for name, content in STATIC_CACHE.items()})
     host = host or os.environ.get("HOST", "0.0.0.0")
     port = port or int(os.environ.get("PORT", "8000"))
     server = ThreadingHTTPServer((host, port), TimetableHandler)